@@ -40,7 +40,7 @@ It returns a generator with result rows.
 the local (class-wise) registry for Ignite Complex objects.
 """
 
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 from typing import Iterable, Type, Union
 
 from .api.binary import get_binary_type, put_binary_type
@@ -71,7 +71,7 @@ class Client(Connection):
      * binary types registration endpoint.
     """
 
-    _registry = defaultdict(dict)
+    _registry = {}
     _compact_footer = None
 
     def _transfer_params(self, to: 'Client'):
@@ -121,15 +121,11 @@ class Client(Connection):
                 return BinaryObject
 
         def convert_schema(
-            field_ids: list, binary_fields: list
+            field_ids: list, binary_fields: dict
         ) -> OrderedDict:
             converted_schema = OrderedDict()
             for field_id in field_ids:
-                binary_field = [
-                    x
-                    for x in binary_fields
-                    if x['field_id'] == field_id
-                ][0]
+                binary_field = binary_fields[field_id]
                 converted_schema[binary_field['field_name']] = convert_type(
                     binary_field['type_id']
                 )
@@ -139,7 +135,11 @@ class Client(Connection):
         if result.status != 0 or not result.value['type_exists']:
             return result
 
-        binary_fields = result.value.pop('binary_fields')
+        # index binary fields by ID once, so that each schema conversion
+        # does not have to scan the whole field list for every field
+        binary_fields = {
+            x['field_id']: x for x in result.value.pop('binary_fields')
+        }
         old_format_schemas = result.value.pop('schema')
         result.value['schemas'] = []
         for s_id, field_ids in old_format_schemas.items():
@@ -221,13 +221,12 @@ class Client(Connection):
         """
         type_info = self.get_binary_type(type_id)
         if type_info['type_exists']:
+            type_name = type_info['type_name']
+            registry = self._registry.setdefault(type_id, {})
             for schema in type_info['schemas']:
-                if not self._registry[type_id].get(schema_id(schema), None):
-                    data_class = self._create_dataclass(
-                        type_info['type_name'],
-                        schema,
-                    )
-                    self._registry[type_id][schema_id(schema)] = data_class
+                s_id = schema_id(schema)
+                if s_id not in registry:
+                    registry[s_id] = self._create_dataclass(type_name, schema)
 
     def register_binary_type(
         self, data_class: Type, affinity_key_field: str=None,
@@ -247,7 +246,9 @@ class Client(Connection):
                 affinity_key_field,
                 schema=data_class.schema,
             )
-        self._registry[data_class.type_id][data_class.schema_id] = data_class
+        self._registry.setdefault(
+            data_class.type_id, {}
+        )[data_class.schema_id] = data_class
 
     def query_binary_type(
         self, binary_type: Union[int, str], schema: Union[int, dict]=None,
@@ -266,13 +267,8 @@ class Client(Connection):
         type_id = entity_id(binary_type)
         s_id = schema_id(schema)
 
-        if schema:
-            try:
-                result = self._registry[type_id][s_id]
-            except KeyError:
-                result = None
-        else:
-            result = self._registry[type_id]
+        type_registry = self._registry.get(type_id, {})
+        result = type_registry.get(s_id) if schema else type_registry
 
         if sync and not result:
             self._sync_binary_registry(type_id)
@@ -25,6 +25,7 @@ import attr
 from pyignite.constants import *
 from pyignite.exceptions import ParseError
 from pyignite.utils import is_binary, is_hinted, is_iterable
+from .primitive import Primitive
 from .type_codes import *
 
 
@@ -127,15 +128,47 @@ class StructArray:
             },
         )
 
+    def build_fixed_element_class(self):
+        """
+        Builds the element class for arrays of fixed-size structures.
+
+        :return: ctypes structure class, if all the fields are primitives,
+         None otherwise.
+        """
+        for _, c_type in self.following:
+            if not isinstance(c_type, type):
+                return None
+            if not issubclass(c_type, Primitive):
+                return None
+
+        return type(
+            'Struct',
+            (ctypes.LittleEndianStructure,),
+            {
+                '_pack_': 1,
+                '_fields_': [
+                    (name, c_type.c_type) for name, c_type in self.following
+                ],
+            },
+        )
+
     def parse(self, client: 'Client'):
         buffer = client.recv(ctypes.sizeof(self.counter_type))
         length = int.from_bytes(buffer, byteorder=PROTOCOL_BYTE_ORDER)
-        fields = []
-
-        for i in range(length):
-            c_type, buffer_fragment = Struct(self.following).parse(client)
-            buffer += buffer_fragment
-            fields.append(('element_{}'.format(i), c_type))
+        element_class = self.build_fixed_element_class()
+
+        if element_class is not None:
+            # all elements have the same size, so read them in one go
+            buffer += client.recv(length * ctypes.sizeof(element_class))
+            fields = [
+                ('element_{}'.format(i), element_class) for i in range(length)
+            ]
+        else:
+            fields = []
+            for i in range(length):
+                c_type, buffer_fragment = Struct(self.following).parse(client)
+                buffer += buffer_fragment
+                fields.append(('element_{}'.format(i), c_type))
 
         data_class = type(
             'StructArray',
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Type, Union
 
 from pyignite.datatypes.base import IgniteDataType
@@ -125,7 +125,18 @@ def entity_id(cache: Union[str, int]) -> int:
     :param cache: entity name or ID,
     :return: entity ID.
     """
-    return cache if type(cache) is int else hashcode(cache.lower())
+    return cache if type(cache) is int else _entity_id_from_name(cache)
+
+
+@lru_cache(maxsize=4096)
+def _entity_id_from_name(name: str) -> int:
+    """
+    Memoized part of :func:`entity_id`.
+
+    :param name: entity name,
+    :return: entity ID.
+    """
+    return hashcode(name.lower())
 
 
 def schema_id(schema: Union[int, dict]) -> int:
@@ -139,8 +150,20 @@ def schema_id(schema: Union[int, dict]) -> int:
         return schema
     if schema is None:
         return 0
-    s_id = FNV1_OFFSET_BASIS if schema else 0
-    for field_name in schema.keys():
+    # schema ID depends only on field names and their order
+    return _schema_id_from_field_names(tuple(schema.keys()))
+
+
+@lru_cache(maxsize=4096)
+def _schema_id_from_field_names(field_names: tuple) -> int:
+    """
+    Memoized part of :func:`schema_id`.
+
+    :param field_names: a tuple of schema field names,
+    :return: schema ID.
+    """
+    s_id = FNV1_OFFSET_BASIS if field_names else 0
+    for field_name in field_names:
         field_id = entity_id(field_name)
         s_id ^= (field_id & 0xff)
         s_id = int_overflow(s_id * FNV1_PRIME)